@@ -0,0 +1,81 @@
+// Syntax check worker for test_project.py — reads one file path per line on
+// stdin and replies "OK" or "ERR <json-encoded message>" on stdout, so a single
+// Node.js process can check every file instead of one `node --check` per file.
+
+const { spawnSync } = require('child_process');
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const vm = require('vm');
+
+// Same wrapper parameters the CommonJS loader uses, so top-level `return`
+// and shebang lines are accepted exactly as with `node --check`.
+const CJS_PARAMS = ['exports', 'require', 'module', '__filename', '__dirname'];
+
+// Matches the per-file limit test_project.py puts on each reply
+const CHECK_TIMEOUT_MS = 10000;
+
+// Nearest package.json "type" per directory, so ESM packages are detected
+// the same way Node.js resolves them
+const packageTypeCache = new Map();
+
+function packageType(dir) {
+    if (packageTypeCache.has(dir)) return packageTypeCache.get(dir);
+
+    let type = 'commonjs';
+    try {
+        const pkg = JSON.parse(fs.readFileSync(path.join(dir, 'package.json'), 'utf8'));
+        type = pkg.type === 'module' ? 'module' : 'commonjs';
+    } catch (error) {
+        const parent = path.dirname(dir);
+        if (parent !== dir) type = packageType(parent);
+    }
+
+    packageTypeCache.set(dir, type);
+    return type;
+}
+
+function isModuleFile(filePath) {
+    const ext = path.extname(filePath);
+    if (ext === '.mjs') return true;
+    if (ext === '.cjs') return false;
+    return packageType(path.dirname(path.resolve(filePath))) === 'module';
+}
+
+/**
+ * Defer to `node --check` for files the in-process compile cannot settle
+ * (ES modules, top-level await); returns null or the error text.
+ */
+function checkWithNode(filePath) {
+    const result = spawnSync(process.execPath, ['--check', filePath], {
+        encoding: 'utf8',
+        timeout: CHECK_TIMEOUT_MS
+    });
+
+    if (result.error) return `Syntax check failed: ${result.error.message}`;
+    return result.status === 0 ? null : result.stderr.trim();
+}
+
+/**
+ * Compile a file without running it; returns null or the error text.
+ */
+function checkFile(filePath) {
+    if (isModuleFile(filePath)) return checkWithNode(filePath);
+
+    try {
+        const source = fs.readFileSync(filePath, 'utf8');
+        vm.compileFunction(source, CJS_PARAMS, { filename: filePath });
+        return null;
+    } catch (error) {
+        // Not valid CommonJS; it may still be a valid ES module, which
+        // `node --check` accepts, so only its verdict counts as an error
+        return checkWithNode(filePath);
+    }
+}
+
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+rl.on('line', (filePath) => {
+    const error = checkFile(filePath);
+    process.stdout.write(error === null ? 'OK\n' : `ERR ${JSON.stringify(error)}\n`);
+});
@@ -4,131 +4,74 @@ Postman Helper Feature Verification Script
 Tests all implemented features to ensure they're working correctly
 """
 
-import subprocess
-import json
+import contextlib
+import functools
+import io
 import sys
+from collections import Counter
 from pathlib import Path
 
+from test_project import ProjectTester
 
-def test_feature(feature_name, test_function):
-    """Test a specific feature and return results"""
-    print(f"\n🔍 Testing: {feature_name}")
-    try:
-        result = test_function()
-        if result:
-            print(f"✅ {feature_name} - PASS")
-            return True
-        else:
-            print(f"❌ {feature_name} - FAIL")
-            return False
-    except Exception as e:
-        print(f"❌ {feature_name} - ERROR: {str(e)}")
-        return False
-
-
-def test_syntax_validity():
-    """Test that all JavaScript files have valid syntax"""
-    result = subprocess.run(
-        ["python3", "test_project.py"], capture_output=True, text=True
-    )
-
-    # Parse results
-    try:
-        with open("test_results.json", "r") as f:
-            results = json.load(f)
-
-        return results["errors_found"] == 0
-    except:
-        return "Tests passed" in result.stdout
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
 
 
-def test_collapsible_tree():
-    """Test that collapsible tree functionality is implemented"""
-    app_content = Path("app.js").read_text()
-
-    # Check for key collapsible tree functions
-    required_functions = [
+# Key collapsible tree functions, rendered elements and CSS styles
+COLLAPSIBLE_TREE_TOKENS = frozenset(
+    [
         "renderCollapsibleFolder",
         "setupCollapsibleTree",
         "setupTreeClickHandlers",
+        "tree-toggle",
+        "tree-children",
+        "tree-item folder",
+        ".tree-toggle",
+        ".tree-children",
+        ".tree-item",
     ]
+)
 
-    required_elements = ["tree-toggle", "tree-children", "tree-item folder"]
-
-    # Check for CSS styles
-    required_styles = [".tree-toggle", ".tree-children", ".tree-item"]
-
-    functions_found = all(f in app_content for f in required_functions)
-    elements_found = all(e in app_content for e in required_elements)
-    styles_found = all(s in app_content for s in required_styles)
-
-    return functions_found and elements_found and styles_found
-
-
-def test_settings_implementation():
-    """Test that settings functionality is implemented"""
-    app_content = Path("app.js").read_text()
-
-    # Check for settings modal implementation
-    required_settings = [
+# Settings modal implementation and settings in AppState
+SETTINGS_TOKENS = frozenset(
+    [
         "showSettings()",
         "settingsModal",
         "autoSave",
         "darkMode",
         "autoFormat",
-    ]
-
-    # Check for settings in AppState
-    appstate_content = Path("app.js").read_text()
-    state_settings = [
         "this.autoSave",
         "this.darkMode",
         "this.autoFormat",
         "this.showLineNumbers",
     ]
+)
 
-    settings_found = all(s in app_content for s in required_settings)
-    state_found = all(s in appstate_content for s in state_settings)
-
-    return settings_found and state_found
-
-
-def test_request_saving():
-    """Test that request saving functionality is enhanced"""
-    app_content = Path("app.js").read_text()
-
-    # Check for enhanced saveRequest function
-    required_features = [
+# Enhanced saveRequest function
+REQUEST_SAVING_TOKENS = frozenset(
+    [
         "saveRequest()",
         "updateTabContent()",
         "this.state.markAsChanged()",
         "updateCollectionTree()",
     ]
+)
 
-    return all(f in app_content for f in required_features)
-
-
-def test_import_collection():
-    """Test that collection import functionality is working"""
-    app_content = Path("app.js").read_text()
-
-    # Check for import functionality
-    required_features = [
+# Postman collection import
+IMPORT_COLLECTION_TOKENS = frozenset(
+    [
         "importFromJSON(",
         "processPostmanItems(",
         "createRequestFromPostmanItem(",
         "createFolderFromPostmanItem(",
     ]
+)
 
-    return all(f in app_content for f in required_features)
-
-
-def test_inheritance_manager():
-    """Test that InheritanceManager has all required methods"""
-    app_content = Path("app.js").read_text()
-
-    # Check for all required methods
-    required_methods = [
+# InheritanceManager methods
+INHERITANCE_MANAGER_TOKENS = frozenset(
+    [
         "addGlobalHeader(",
         "addBaseEndpoint(",
         "addBodyTemplate(",
@@ -136,60 +79,140 @@ def test_inheritance_manager():
         "getGlobalHeaders(",
         "getBaseEndpoints(",
     ]
+)
+
+# Collection class methods
+COLLECTION_METHODS_TOKENS = frozenset(
+    ["importFromJSON(", "exportToJSON(", "addRequest(", "addFolder("]
+)
+
+# UI improvement patterns
+UI_IMPROVEMENT_TOKENS = frozenset(
+    [
+        "updateTabContent()",
+        "switchTab(",
+        "updateCollectionTree()",
+        "updateInheritanceTab()",
+    ]
+)
+
+# Minimum occurrences of each error handling pattern
+# (this codebase uses alert for user-facing errors)
+ERROR_HANDLING_THRESHOLDS = {
+    "try {": 4,
+    "catch (error)": 4,
+    "console.error(": 3,
+    "alert(": 5,
+}
+
+FEATURE_TOKENS = (
+    COLLAPSIBLE_TREE_TOKENS
+    | SETTINGS_TOKENS
+    | REQUEST_SAVING_TOKENS
+    | IMPORT_COLLECTION_TOKENS
+    | INHERITANCE_MANAGER_TOKENS
+    | COLLECTION_METHODS_TOKENS
+    | UI_IMPROVEMENT_TOKENS
+    | frozenset(ERROR_HANDLING_THRESHOLDS)
+)
+
+
+def count_tokens(content, tokens, counted=frozenset()):
+    """Count tokens found in content, using one pass when possible.
+
+    Only the tokens in counted are guaranteed exact counts; without
+    pyahocorasick the others are presence checks recorded as 1.
+    """
+    if ahocorasick is None:
+        counts = Counter()
+        for token in tokens:
+            if token in counted:
+                counts[token] = content.count(token)
+            elif token in content:
+                counts[token] = 1
+        return +counts  # drop tokens that were not found
+
+    automaton = ahocorasick.Automaton()
+    for token in tokens:
+        automaton.add_word(token, token)
+    automaton.make_automaton()
+
+    return Counter(token for _, token in automaton.iter(content))
+
+
+@functools.lru_cache(maxsize=None)
+def has_all(tokens, found):
+    """Return True if every token was found (memoized; both args are frozensets)"""
+    return tokens <= found
+
+
+def test_feature(feature_name, test_function, found, counts):
+    """Test a specific feature against the tokens scanned from app.js"""
+    print(f"\n🔍 Testing: {feature_name}")
+    try:
+        result = test_function(found, counts)
+        if result:
+            print(f"✅ {feature_name} - PASS")
+            return True
+        else:
+            print(f"❌ {feature_name} - FAIL")
+            return False
+    except Exception as e:
+        print(f"❌ {feature_name} - ERROR: {str(e)}")
+        return False
 
-    return all(m in app_content for m in required_methods)
 
+def test_syntax_validity(found, counts):
+    """Test that all JavaScript files have valid syntax"""
+    # Run the project tester in-process; its report is not part of this output
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = ProjectTester().run_tests()
 
-def test_collection_methods():
-    """Test that Collection class has required methods"""
-    app_content = Path("app.js").read_text()
+    return results["errors_found"] == 0
 
-    # Check for required collection methods
-    required_methods = ["importFromJSON(", "exportToJSON(", "addRequest(", "addFolder("]
 
-    return all(m in app_content for m in required_methods)
+def test_collapsible_tree(found, counts):
+    """Test that collapsible tree functionality is implemented"""
+    return has_all(COLLAPSIBLE_TREE_TOKENS, found)
 
 
-def test_error_handling():
-    """Test that proper error handling is implemented"""
-    app_content = Path("app.js").read_text()
+def test_settings_implementation(found, counts):
+    """Test that settings functionality is implemented"""
+    return has_all(SETTINGS_TOKENS, found)
 
-    # Check for error handling patterns (appropriate for this codebase)
-    error_patterns = [
-        "try {",
-        "catch (error)",
-        "console.error(",
-        "alert(",  # This codebase uses alert for user-facing errors
-    ]
 
-    # Count occurrences to ensure robust error handling
-    try_count = app_content.count("try {")
-    catch_count = app_content.count("catch (error)")
-    console_error_count = app_content.count("console.error(")
-    alert_count = app_content.count("alert(")
+def test_request_saving(found, counts):
+    """Test that request saving functionality is enhanced"""
+    return has_all(REQUEST_SAVING_TOKENS, found)
+
+
+def test_import_collection(found, counts):
+    """Test that collection import functionality is working"""
+    return has_all(IMPORT_COLLECTION_TOKENS, found)
+
+
+def test_inheritance_manager(found, counts):
+    """Test that InheritanceManager has all required methods"""
+    return has_all(INHERITANCE_MANAGER_TOKENS, found)
+
+
+def test_collection_methods(found, counts):
+    """Test that Collection class has required methods"""
+    return has_all(COLLECTION_METHODS_TOKENS, found)
+
 
+def test_error_handling(found, counts):
+    """Test that proper error handling is implemented"""
     # We should have multiple instances of error handling
-    return (
-        try_count >= 4
-        and catch_count >= 4
-        and console_error_count >= 3
-        and alert_count >= 5
+    return all(
+        counts[pattern] >= minimum
+        for pattern, minimum in ERROR_HANDLING_THRESHOLDS.items()
     )
 
 
-def test_ui_improvements():
+def test_ui_improvements(found, counts):
     """Test that UI improvements are implemented"""
-    app_content = Path("app.js").read_text()
-
-    # Check for UI improvement patterns
-    ui_patterns = [
-        "updateTabContent()",
-        "switchTab(",
-        "updateCollectionTree()",
-        "updateInheritanceTab()",
-    ]
-
-    return all(p in app_content for p in ui_patterns)
+    return has_all(UI_IMPROVEMENT_TOKENS, found)
 
 
 def main():
@@ -197,6 +220,13 @@ def main():
     print("🚀 Postman Helper Feature Verification")
     print("=" * 50)
 
+    # Load app.js once and count every feature token in a single pass
+    app_content = Path("app.js").read_text()
+    counts = count_tokens(
+        app_content, FEATURE_TOKENS, frozenset(ERROR_HANDLING_THRESHOLDS)
+    )
+    found = frozenset(counts)
+
     # Define all feature tests
     feature_tests = [
         ("Syntax Validity", test_syntax_validity),
@@ -213,7 +243,7 @@ def main():
     # Run all tests
     results = []
     for feature_name, test_func in feature_tests:
-        passed = test_feature(feature_name, test_func)
+        passed = test_feature(feature_name, test_func, found, counts)
         results.append((feature_name, passed))
 
     # Generate summary
@@ -6,18 +6,158 @@ in the Postman Helper project after changes are made.
 """
 
 import os
+import queue
 import subprocess
 import json
 import re
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 import sys
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+SYNTAX_WORKER = Path(__file__).resolve().with_name("syntax_worker.js")
+
+# Seconds to wait for the syntax worker to answer for a single file
+SYNTAX_TIMEOUT = 10
+
+# Per-file results, one JSON object per line, written as each file is tested
+RESULTS_JSONL = "test_results.jsonl"
+
+# Function declarations are found by locating each keyword with find() and
+# matching only what follows it, instead of trying a three-way regex alternation
+# at every word boundary. Every pattern is compiled for both ASCII bytes and
+# decoded text (see _read_source) so the same scans work on either.
+_IDENTIFIER = r"([a-zA-Z_$][0-9a-zA-Z_$]*)"
+
+
+def _compile_both(pattern: str, flags: int = 0) -> Dict[type, "re.Pattern"]:
+    """Compile a pattern for both ASCII bytes and decoded text"""
+    return {
+        bytes: re.compile(pattern.encode("ascii"), flags),
+        str: re.compile(pattern, flags),
+    }
+
+
+_DECLARATION_TAILS = (
+    ("function", _compile_both(r"\s+" + _IDENTIFIER)),
+    ("const", _compile_both(r"\s+" + _IDENTIFIER + r"\s*=\s*function")),
+    ("class", _compile_both(r"\s+" + _IDENTIFIER)),
+)
+
+# Linting patterns; [^\S\n] keeps whitespace matches from running onto the
+# next line. The leading \b is checked with _is_word_char and comment lines with
+# _COMMENT_LINE_RE, so the regex engine can search for the literal prefix
+_CONSOLE_LOG_RE = _compile_both(r"console\.log[^\S\n]*\(")
+_DEBUGGER_RE = _compile_both(r"debugger[^\S\n]*;")
+_COMMENT_LINE_RE = _compile_both(r"[^\S\n]*//")
+_LONG_LINE_RE = _compile_both(r"^.{121,}", re.M)
+
+
+def _read_source(file_path: Path) -> Union[bytes, str]:
+    """Read a source file for scanning.
+
+    Plain ASCII files with LF line endings are returned as bytes, where the
+    bytes patterns behave exactly like the text ones. Anything else is decoded
+    the way open() in text mode would (UTF-8, universal newlines) so that
+    Unicode word boundaries, whitespace and line endings are unchanged.
+    """
+    content = file_path.read_bytes()
+    if content.isascii() and b"\r" not in content:
+        return content
+
+    text = content.decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _dump_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data as UTF-8 JSON, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _is_word_char(char: Union[bytes, str]) -> bool:
+    """Whether a one-character slice is a regex word character (as for \\b)"""
+    return char.isalnum() or char in ("_", b"_")
+
+
+def _iter_declarations(content: Union[bytes, str]):
+    """Yield (declaration, name) pairs in source order, matching what a
+    non-overlapping regex scan for function/const/class declarations finds"""
+    kind = type(content)
+    matches = []
+    for keyword, tail_res in _DECLARATION_TAILS:
+        if kind is bytes:
+            keyword = keyword.encode("ascii")
+        tail_re = tail_res[kind]
+
+        start = content.find(keyword)
+        while start != -1:
+            if start == 0 or not _is_word_char(content[start - 1 : start]):
+                tail = tail_re.match(content, start + len(keyword))
+                if tail:
+                    matches.append((start, tail.end(), tail.group(1)))
+            start = content.find(keyword, start + 1)
+
+    matches.sort()
+
+    # Like finditer, skip keywords inside an earlier declaration
+    # (e.g. the "function" in "const x = function")
+    end = 0
+    for start, stop, name in matches:
+        if start >= end:
+            yield content[start:stop], name
+            end = stop
+
+
+# Directories that never contain project sources
+_SKIP_DIRS = frozenset({"node_modules", ".git", "dist"})
+
+
+def _iter_js_files(root: Path):
+    """Walk root depth-first in os.walk order, pruning skipped directories"""
+    stack = [str(root)]
+
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.is_file() and entry.name.endswith(".js"):
+                        if not entry.name.endswith(".test.js"):
+                            yield Path(entry.path)
+        except OSError:
+            continue
+
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
 
 
 class ProjectTester:
-    def __init__(self, project_dir: str = "."):
+    def __init__(self, project_dir: str = ".", verbose: bool = False):
         self.project_dir = Path(project_dir)
+        self.verbose = verbose
         self.js_files = []
+        self._node = None
+        self._replies = None
+        self._log = []
         self.test_results = {
             "files_tested": 0,
             "functions_tested": 0,
@@ -25,106 +165,148 @@ class ProjectTester:
             "warnings_found": 0,
             "passed_tests": 0,
             "failed_tests": 0,
-            "file_results": {},
         }
 
     def find_js_files(self) -> List[Path]:
-        """Find all JavaScript files in the project"""
-        js_files = []
-
-        for root, dirs, files in os.walk(self.project_dir):
-            # Skip node_modules directory
-            if "node_modules" in root:
-                continue
+        """Find all JavaScript files in the project (cached after the first walk)"""
+        if not self.js_files:
+            self.js_files = list(_iter_js_files(self.project_dir))
 
-            for file in files:
-                if file.endswith(".js") and not file.endswith(".test.js"):
-                    js_files.append(Path(root) / file)
+        return self.js_files
 
-        return js_files
-
-    def extract_functions(self, file_path: Path) -> List[str]:
+    @staticmethod
+    def extract_functions(file_path: Path) -> List[str]:
         """Extract function names from a JavaScript file"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Simple pattern to match function declarations (more robust)
-            function_pattern = r"\b(function\s+([a-zA-Z_$][0-9a-zA-Z_$]*)|const\s+([a-zA-Z_$][0-9a-zA-Z_$]*)\s*=\s*function|class\s+([a-zA-Z_$][0-9a-zA-Z_$]*))"
-
-            functions = []
-            try:
-                for match in re.finditer(function_pattern, content):
-                    # Get all captured groups and filter out None values
-                    func_names = [group for group in match.groups() if group]
-                    functions.extend(func_names)
-            except re.error as e:
-                print(f"Regex error in {file_path}: {e}")
-                # Fallback: try to find function keywords
-                if "function" in content or "class" in content:
-                    functions.append("functions_found")
-
-            # Remove duplicates while preserving order
-            return list(dict.fromkeys(functions))
-
-        except Exception as e:
+            content = _read_source(file_path)
+        except (OSError, UnicodeDecodeError) as e:
             print(f"Error reading {file_path}: {e}")
             return []
 
+        # Each declaration contributes its full text and its name;
+        # skip duplicates as they are found, preserving order
+        seen = set()
+        functions = []
+        for declaration in _iter_declarations(content):
+            for text in declaration:
+                if text not in seen:
+                    seen.add(text)
+                    if isinstance(text, bytes):
+                        text = text.decode("ascii")
+                    functions.append(text)
+
+        return functions
+
     def test_file_syntax(self, file_path: Path) -> Tuple[bool, List[str]]:
-        """Test JavaScript file syntax using Node.js"""
+        """Test JavaScript file syntax using the shared Node.js worker"""
         errors = []
 
         try:
-            # Use Node.js to check syntax
-            result = subprocess.run(
-                ["node", "--check", str(file_path)],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+            # Start one Node.js process for all files instead of one per file
+            if self._node is None:
+                self._start_syntax_worker()
+
+            self._node.stdin.write(f"{file_path}\n")
+            self._node.stdin.flush()
 
-            if result.returncode != 0:
-                errors.append(f"Syntax error: {result.stderr.strip()}")
+            try:
+                reply = self._replies.get(timeout=SYNTAX_TIMEOUT)
+            except queue.Empty:
+                # Restart the worker on the next file instead of waiting forever
+                self._stop_syntax_worker()
+                errors.append("Syntax check timed out")
+                return False, errors
+
+            if not reply:
+                self._stop_syntax_worker()
+                raise RuntimeError("syntax worker exited unexpectedly")
+
+            if reply.startswith("ERR "):
+                errors.append(f"Syntax error: {json.loads(reply[4:])}")
                 return False, errors
 
             return True, []
 
-        except subprocess.TimeoutExpired:
-            errors.append("Syntax check timed out")
-            return False, errors
         except Exception as e:
             errors.append(f"Syntax check failed: {str(e)}")
             return False, errors
 
-    def test_file_linting(self, file_path: Path) -> Tuple[bool, List[str]]:
+    def _start_syntax_worker(self):
+        """Start the Node.js syntax worker and a thread collecting its replies"""
+        self._node = subprocess.Popen(
+            ["node", str(SYNTAX_WORKER)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        self._replies = queue.Queue()
+        threading.Thread(
+            target=_read_replies, args=(self._node.stdout, self._replies), daemon=True
+        ).start()
+
+    def _stop_syntax_worker(self):
+        """Kill a stuck or crashed syntax worker"""
+        self._node.kill()
+        self._node.wait()
+        self._node = None
+
+    def close(self):
+        """Stop the syntax check worker if it is running"""
+        if self._node is not None:
+            self._node.stdin.close()
+            self._node.wait()
+            self._node = None
+
+    @staticmethod
+    def test_file_linting(file_path: Path) -> Tuple[bool, List[str]]:
         """Test JavaScript file linting using basic checks"""
         warnings = []
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Basic linting checks
-            lines = content.split("\n")
-
-            # Check for common issues
-            for i, line in enumerate(lines, 1):
-                # Check for console.log statements (should be removed in production)
-                if re.search(
-                    r"\bconsole\.log\s*\(", line
-                ) and not line.strip().startswith("//"):
-                    warnings.append(f"Line {i}: console.log statement found")
-
-                # Check for debug statements
-                if re.search(r"\bdebugger\s*;", line) and not line.strip().startswith(
-                    "//"
-                ):
-                    warnings.append(f"Line {i}: debugger statement found")
-
-                # Check for very long lines (> 120 characters)
-                if len(line) > 120:
-                    warnings.append(f"Line {i}: Line too long ({len(line)} characters)")
+            content = _read_source(file_path)
+            kind = type(content)
+            newline = b"\n" if kind is bytes else "\n"
+
+            # Scan the whole file once per check; every match starts at the
+            # beginning of its line so results can be merged back in line order
+            findings = []
+
+            # Check for console.log statements (should be removed in production)
+            # and debug statements, at most once per non-comment line
+            statement_checks = (
+                (_CONSOLE_LOG_RE[kind], 0, "console.log statement found"),
+                (_DEBUGGER_RE[kind], 1, "debugger statement found"),
+            )
+            for statement_re, order, message in statement_checks:
+                last_line_start = -1
+                for match in statement_re.finditer(content):
+                    start = match.start()
+                    if start and _is_word_char(content[start - 1 : start]):
+                        continue
+                    line_start = content.rfind(newline, 0, start) + 1
+                    if line_start == last_line_start:
+                        continue
+                    last_line_start = line_start
+                    if not _COMMENT_LINE_RE[kind].match(content, line_start):
+                        findings.append((line_start, order, message))
+
+            # Check for very long lines (> 120 characters); bytes content is
+            # ASCII, so its length in bytes is its length in characters
+            for match in _LONG_LINE_RE[kind].finditer(content):
+                length = match.end() - match.start()
+                findings.append(
+                    (match.start(), 2, f"Line too long ({length} characters)")
+                )
+
+            findings.sort()
+
+            # Convert offsets to line numbers, counting newlines only once
+            line, offset = 1, 0
+            for start, _, message in findings:
+                line += content.count(newline, offset, start)
+                offset = start
+                warnings.append(f"Line {line}: {message}")
 
             return len(warnings) == 0, warnings
 
@@ -132,214 +314,121 @@ class ProjectTester:
             warnings.append(f"Linting failed: {str(e)}")
             return False, warnings
 
-    def test_function_existence(
-        self, file_path: Path, functions: List[str]
-    ) -> Tuple[bool, List[str]]:
-        """Test that functions exist and are callable"""
-        errors = []
+    def _emit(self, line: str = ""):
+        """Print a report line now when verbose, otherwise buffer it"""
+        if self.verbose:
+            print(line)
+        else:
+            self._log.append(line)
 
-        try:
-            # Create a simple test script that tries to access the functions
-            test_script = """
-try {
-    // Try to require the module - this may fail for browser-only files
-    let moduleExports = null;
-    try {
-        const modulePath = process.argv[1];
-        moduleExports = require(modulePath);
-    } catch (requireError) {
-        // If require fails, we'll just assume functions exist based on syntax
-        // This is common for browser-only JavaScript files
-        const functionsToTest = JSON.parse(process.argv[2]);
-        const results = functionsToTest.map(funcName => ({
-            name: funcName,
-            exists: true, 
-            type: 'assumed' // We assume it exists based on syntax parsing
-        }));
-        console.log(JSON.stringify(results));
-        process.exit(0);
-    }
-    
-    const functionsToTest = JSON.parse(process.argv[2]);
-    const results = [];
-    
-    for (const funcName of functionsToTest) {
-        let found = false;
-        
-        // Check if it's a direct export
-        if (moduleExports && moduleExports[funcName]) {
-            found = true;
-            results.push({ name: funcName, exists: true, type: 'exported' });
-        }
-        // Check if it's a class method
-        else if (moduleExports && typeof moduleExports === 'object') {
-            for (const exportName in moduleExports) {
-                const exportedItem = moduleExports[exportName];
-                if (exportedItem && exportedItem.prototype && exportedItem.prototype[funcName]) {
-                    found = true;
-                    results.push({ name: funcName, exists: true, type: 'method', class: exportName });
-                    break;
-                }
-            }
-        }
-        
-        if (!found) {
-            results.push({ name: funcName, exists: false });
-        }
-    }
-    
-    console.log(JSON.stringify(results));
-} catch (error) {
-    console.log(JSON.stringify({ error: error.message }));
-}
-"""
+    def _flush_log(self):
+        """Write all buffered report lines with a single write"""
+        if self._log:
+            sys.stdout.write("\n".join(self._log) + "\n")
+            self._log.clear()
 
-            # Write test script to temp file
-            temp_script = self.project_dir / "temp_test.js"
-            with open(temp_script, "w", encoding="utf-8") as f:
-                f.write(test_script)
-
-            # Run the test script
-            result = subprocess.run(
-                ["node", str(temp_script), str(file_path), json.dumps(functions)],
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
+    def run_tests(self) -> Dict[str, Any]:
+        """Run all tests on the project"""
+        self._emit("🔍 Starting Postman Helper Project Tests...")
+        self._emit("=" * 60)
 
-            # Clean up temp file
-            temp_script.unlink()
+        # Find all JavaScript files
+        self.find_js_files()
+        self._emit(f"📁 Found {len(self.js_files)} JavaScript files to test")
 
-            if result.returncode != 0:
-                errors.append(f"Function test failed: {result.stderr.strip()}")
-                return False, errors
+        # Analyse files in parallel while the Node.js worker checks syntax, and
+        # report each file serially so output from different files never interleaves
+        try:
+            workers = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor, open(
+                self.project_dir / RESULTS_JSONL, "wb"
+            ) as results_out:
+                analyses = _map_bounded(
+                    executor, _test_one_file, self.js_files, 2 * workers
+                )
+                for file_path, file_results in zip(self.js_files, analyses):
+                    syntax_valid, syntax_errors = self.test_file_syntax(file_path)
+                    file_results["syntax_valid"] = syntax_valid
+                    file_results["syntax_errors"] = syntax_errors
+
+                    # Report and count this file, then stream its results out
+                    # so only the counters are kept in memory
+                    relative_path = file_path.relative_to(self.project_dir)
+                    self._record_file(relative_path, file_results)
+
+                    record = {"path": str(relative_path), **file_results}
+                    results_out.write(_dump_json(record) + b"\n")
+                    self._flush_log()
+
+            # Generate summary
+            self.generate_summary()
+        finally:
+            # Write out anything still buffered, even if the run failed
+            self.close()
+            self._flush_log()
 
-            # Parse results
-            try:
-                test_results = json.loads(result.stdout.strip())
-                if isinstance(test_results, dict) and "error" in test_results:
-                    errors.append(f"Function test error: {test_results['error']}")
-                    return False, errors
-
-                # Check for missing functions
-                missing_functions = []
-                for func_result in test_results:
-                    if not func_result["exists"]:
-                        missing_functions.append(func_result["name"])
-
-                if missing_functions:
-                    errors.append(
-                        f"Functions not found: {', '.join(missing_functions)}"
-                    )
-                    return False, errors
-
-                return True, []
-
-            except json.JSONDecodeError:
-                errors.append(f"Invalid function test output: {result.stdout.strip()}")
-                return False, errors
+        return self.test_results
 
-        except Exception as e:
-            errors.append(f"Function existence test failed: {str(e)}")
-            return False, errors
+    def _record_file(self, relative_path: Path, file_results: Dict[str, Any]):
+        """Report one file's results and add them to the run counters"""
+        self._emit(f"\n📄 Testing: {relative_path}")
 
-    def run_tests(self) -> Dict[str, Any]:
-        """Run all tests on the project"""
-        print("🔍 Starting Postman Helper Project Tests...")
-        print("=" * 60)
+        functions = file_results["functions_found"]
+        self._emit(f"  🔧 Found {len(functions)} functions/classes")
 
-        # Find all JavaScript files
-        self.js_files = self.find_js_files()
-        print(f"📁 Found {len(self.js_files)} JavaScript files to test")
-
-        # Test each file
-        for file_path in self.js_files:
-            relative_path = file_path.relative_to(self.project_dir)
-            print(f"\n📄 Testing: {relative_path}")
-
-            file_results = {
-                "syntax_valid": False,
-                "linting_passed": False,
-                "functions_valid": True,  # Default to True if no functions to test
-                "syntax_errors": [],
-                "linting_warnings": [],
-                "function_errors": [],
-                "functions_found": [],
-            }
-
-            # Extract functions
-            functions = self.extract_functions(file_path)
-            file_results["functions_found"] = functions
-            print(f"  🔧 Found {len(functions)} functions/classes")
-
-            # Test syntax
-            print("  🔍 Checking syntax...")
-            syntax_valid, syntax_errors = self.test_file_syntax(file_path)
-            file_results["syntax_valid"] = syntax_valid
-            file_results["syntax_errors"] = syntax_errors
-
-            if syntax_valid:
-                print("  ✅ Syntax valid")
-            else:
-                print("  ❌ Syntax errors found:")
-                for error in syntax_errors:
-                    print(f"    - {error}")
-
-            # Test linting
-            print("  🔍 Checking linting...")
-            linting_passed, linting_warnings = self.test_file_linting(file_path)
-            file_results["linting_passed"] = linting_passed
-            file_results["linting_warnings"] = linting_warnings
-
-            if linting_passed:
-                print("  ✅ Linting passed")
-            else:
-                print("  ⚠️  Linting warnings:")
-                for warning in linting_warnings:
-                    print(f"    - {warning}")
-
-            # Initialize function test variables
-            functions_valid = True
-            function_errors = []
-
-            # Test function existence (only if syntax is valid and functions exist)
-            if syntax_valid and functions:
-                print("  🔍 Checking function existence...")
-
-                # For now, we'll assume functions exist if syntax is valid
-                # This is a reasonable assumption for the test script
-                # The complex function existence testing was causing issues
-                print("  ✅ All functions valid (assumed based on syntax)")
-                file_results["functions_valid"] = True
-                file_results["function_errors"] = []
-            else:
-                if not functions:
-                    print("  ℹ️  No functions to test")
-                # functions_valid and function_errors already initialized above
-
-            # Update test results
-            self.test_results["file_results"][str(relative_path)] = file_results
-            self.test_results["files_tested"] += 1
-            self.test_results["functions_tested"] += len(functions)
-            self.test_results["errors_found"] += len(syntax_errors) + len(
-                function_errors
-            )
-            self.test_results["warnings_found"] += len(linting_warnings)
+        self._emit("  🔍 Checking syntax...")
+        syntax_valid = file_results["syntax_valid"]
+        syntax_errors = file_results["syntax_errors"]
 
-            if syntax_valid and (not functions or functions_valid):
-                self.test_results["passed_tests"] += 1
-            else:
-                self.test_results["failed_tests"] += 1
+        if syntax_valid:
+            self._emit("  ✅ Syntax valid")
+        else:
+            self._emit("  ❌ Syntax errors found:")
+            for error in syntax_errors:
+                self._emit(f"    - {error}")
 
-        # Generate summary
-        self.generate_summary()
-        return self.test_results
+        self._emit("  🔍 Checking linting...")
+        linting_warnings = file_results["linting_warnings"]
+
+        if file_results["linting_passed"]:
+            self._emit("  ✅ Linting passed")
+        else:
+            self._emit("  ⚠️  Linting warnings:")
+            for warning in linting_warnings:
+                self._emit(f"    - {warning}")
+
+        functions_valid = file_results["functions_valid"]
+        function_errors = file_results["function_errors"]
+
+        # Test function existence (only if syntax is valid and functions exist)
+        if syntax_valid and functions:
+            self._emit("  🔍 Checking function existence...")
+
+            # For now, we'll assume functions exist if syntax is valid
+            # This is a reasonable assumption for the test script
+            # The complex function existence testing was causing issues
+            self._emit("  ✅ All functions valid (assumed based on syntax)")
+        elif not functions:
+            self._emit("  ℹ️  No functions to test")
+
+        # Update test results
+        self.test_results["files_tested"] += 1
+        self.test_results["functions_tested"] += len(functions)
+        self.test_results["errors_found"] += len(syntax_errors) + len(
+            function_errors
+        )
+        self.test_results["warnings_found"] += len(linting_warnings)
+
+        if syntax_valid and (not functions or functions_valid):
+            self.test_results["passed_tests"] += 1
+        else:
+            self.test_results["failed_tests"] += 1
 
     def generate_summary(self):
         """Generate and print test summary"""
-        print("\n" + "=" * 60)
-        print("📊 TEST SUMMARY")
-        print("=" * 60)
+        self._emit("\n" + "=" * 60)
+        self._emit("📊 TEST SUMMARY")
+        self._emit("=" * 60)
 
         total_files = self.test_results["files_tested"]
         total_functions = self.test_results["functions_tested"]
@@ -348,38 +437,82 @@ try {
         passed = self.test_results["passed_tests"]
         failed = self.test_results["failed_tests"]
 
-        print(f"📁 Files tested: {total_files}")
-        print(f"🔧 Functions tested: {total_functions}")
-        print(f"✅ Tests passed: {passed}")
-        print(f"❌ Tests failed: {failed}")
-        print(f"🚨 Errors found: {total_errors}")
-        print(f"⚠️  Warnings found: {total_warnings}")
+        self._emit(f"📁 Files tested: {total_files}")
+        self._emit(f"🔧 Functions tested: {total_functions}")
+        self._emit(f"✅ Tests passed: {passed}")
+        self._emit(f"❌ Tests failed: {failed}")
+        self._emit(f"🚨 Errors found: {total_errors}")
+        self._emit(f"⚠️  Warnings found: {total_warnings}")
 
         if failed > 0:
-            print(f"\n💥 PROJECT STATUS: FAILED")
-            print("Some tests failed. Please review the errors above.")
+            self._emit(f"\n💥 PROJECT STATUS: FAILED")
+            self._emit("Some tests failed. Please review the errors above.")
         elif total_warnings > 0:
-            print(f"\n⚠️  PROJECT STATUS: PASSED WITH WARNINGS")
-            print("All critical tests passed, but some warnings were found.")
+            self._emit(f"\n⚠️  PROJECT STATUS: PASSED WITH WARNINGS")
+            self._emit("All critical tests passed, but some warnings were found.")
         else:
-            print(f"\n🎉 PROJECT STATUS: ALL TESTS PASSED")
-            print("Great job! All tests passed successfully.")
+            self._emit(f"\n🎉 PROJECT STATUS: ALL TESTS PASSED")
+            self._emit("Great job! All tests passed successfully.")
 
-        print("=" * 60)
+        self._emit("=" * 60)
 
         # Save results to file
         results_file = self.project_dir / "test_results.json"
-        with open(results_file, "w", encoding="utf-8") as f:
-            json.dump(self.test_results, f, indent=2)
+        results_file.write_bytes(_dump_json(self.test_results, indent=True))
+
+        self._emit(f"📄 Test results saved to: {results_file}")
+        jsonl_file = self.project_dir / RESULTS_JSONL
+        self._emit(f"📄 Per-file results saved to: {jsonl_file}")
+
+
+def _read_replies(stream, replies: "queue.Queue[str]"):
+    """Forward worker output lines to a queue; an empty string marks EOF"""
+    for line in stream:
+        replies.put(line)
+    replies.put("")
+
+
+def _map_bounded(executor, fn, items, window: int):
+    """Like executor.map, but with at most window tasks in flight so finished
+    results never pile up ahead of the consumer"""
+    items = iter(items)
+    pending = deque(executor.submit(fn, item) for item in islice(items, window))
+
+    while pending:
+        future = pending.popleft()
+        for item in islice(items, 1):
+            pending.append(executor.submit(fn, item))
+        yield future.result()
+
+
+def _test_one_file(file_path: Path) -> Dict[str, Any]:
+    """Run the pure-Python per-file checks (module-level for worker processes)"""
+    file_results = {
+        "syntax_valid": False,
+        "linting_passed": False,
+        "functions_valid": True,  # Default to True if no functions to test
+        "syntax_errors": [],
+        "linting_warnings": [],
+        "function_errors": [],
+        "functions_found": [],
+    }
+
+    # Extract functions
+    file_results["functions_found"] = ProjectTester.extract_functions(file_path)
+
+    # Test linting
+    linting_passed, linting_warnings = ProjectTester.test_file_linting(file_path)
+    file_results["linting_passed"] = linting_passed
+    file_results["linting_warnings"] = linting_warnings
 
-        print(f"📄 Test results saved to: {results_file}")
+    return file_results
 
 
 def main():
     """Main function to run the project tester"""
     try:
-        # Create tester instance
-        tester = ProjectTester()
+        # Create tester instance; report lines are buffered unless --verbose
+        tester = ProjectTester(verbose="--verbose" in sys.argv[1:])
 
         # Run tests
         results = tester.run_tests()